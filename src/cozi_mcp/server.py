@@ -7,509 +7,805 @@ as tools that can be used by AI assistants like Claude Desktop, configured for d
 on Smithery.ai.
 
 The server uses py-cozi-client>=1.3.0 which uses pydantic models for all data objects.
-All tools return the API objects directly as JSON using the pydantic model_dump() method.
+Tools that return API objects serialize them straight to JSON text with pydantic-core
+(model_dump_json() / TypeAdapter.dump_json()), so FastMCP passes the payload through
+without encoding it a second time.
 """
 
+import asyncio
+import functools
+import inspect
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import asynccontextmanager
+from datetime import date, datetime, time as time_of_day
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
+import aiohttp
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.types import CallToolResult, TextContent
 from smithery.decorators import smithery
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic_core import to_json
 
 # Import from py-cozi-client>=1.3.0
 from cozi_client import (
     CoziClient, 
     CoziList, 
+    CoziItem,
     CoziAppointment,
+    CoziPerson,
     ListType, 
     ItemStatus,
     CoziException,
-    AuthenticationError
+    AuthenticationError,
+    ValidationError
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+class _JsonLogFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return to_json(entry).decode()
+
 logger = logging.getLogger("cozi-mcp")
 
+def _configure_logging() -> None:
+    """Send INFO and above to stderr as JSON, unless the host configured logging already."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(_JsonLogFormatter())
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
 # Configuration schema for Smithery deployment
 class CoziConfigSchema(BaseModel):
+    # Smithery builds one per request and the tools only read it
+    model_config = ConfigDict(frozen=True)
+
     username: str = Field(description="Cozi account username/email")
     password: str = Field(description="Cozi account password")
 
-# Global client instance
-cozi_client: Optional[CoziClient] = None
+# Serialization options shared by every tool response
+_DUMP_KWARGS: Dict[str, Any] = {"exclude_none": True}
 
-async def get_cozi_client(username: str, password: str) -> CoziClient:
-    """Get or create the Cozi client instance."""
-    global cozi_client
-    
-    if cozi_client is None:
-        if not username or not password:
-            raise AuthenticationError("Cozi username and password must be provided")
-        
-        cozi_client = CoziClient(username, password)
-        await cozi_client.authenticate()
-    
-    return cozi_client
+# Serializers, enum lookups and canned results below are all built once at import
 
-@smithery.server(config_schema=CoziConfigSchema)
-def create_server():
-    """Create the Cozi MCP server for Smithery deployment."""
-    mcp = FastMCP("cozi-mcp")
-    
-    # Family member tools
-    @mcp.tool()
-    async def get_family_members(ctx: Context) -> List[Dict[str, Any]]:
-        """Get all family members in the Cozi account.
-
-        This is often used as a first step when creating appointments with specific attendees.
-        Use the 'id' field from each family member when specifying attendees for appointments.
-
-        Returns:
-            List of family member objects with their details including:
-            - id: Unique identifier (use this for appointment attendees)
-            - name: Display name
-            - Other member details
-
-        Example workflow:
-            1. Call get_family_members() to get family member IDs
-            2. Use those IDs in the attendees parameter when creating appointments
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            family_members = await client.get_family_members()
-            
-            # Return the pydantic models as dictionaries directly
-            return [member.model_dump() for member in family_members]
-        
-        except CoziException as e:
-            logger.error(f"Cozi API error in get_family_members: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in get_family_members")
-            raise
+# JSON serializers for list responses
+_family_members_adapter = TypeAdapter(List[CoziPerson])
+_lists_adapter = TypeAdapter(List[CoziList])
+_appointments_adapter = TypeAdapter(List[CoziAppointment])
 
-    # List management tools
-    @mcp.tool()
-    async def get_lists(ctx: Context) -> List[Dict[str, Any]]:
-        """Get all lists (shopping and todo lists).
-        
-        Returns:
-            List of list objects with their items
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            lists = await client.get_lists()
-            
-            # Return the pydantic models as dictionaries directly
-            return [list_item.model_dump() for list_item in lists]
-        
-        except CoziException as e:
-            logger.error(f"Cozi API error in get_lists: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in get_lists")
-            raise
+# Tool argument values mapped to client enums
+_LIST_TYPE_MAP: Dict[str, ListType] = {member.value: member for member in ListType}
+_ITEM_STATUS_BY_COMPLETED: Tuple[ItemStatus, ItemStatus] = (ItemStatus.INCOMPLETE, ItemStatus.COMPLETE)
 
-    @mcp.tool()
-    async def get_lists_by_type(list_type: str, ctx: Context) -> List[Dict[str, Any]]:
-        """Get lists filtered by type.
-        
-        Args:
-            list_type: Type of lists to retrieve ('shopping' or 'todo')
-            
-        Returns:
-            List of list objects filtered by type
-        """
-        try:
-            # Convert string to ListType enum
-            list_type_enum = ListType.SHOPPING if list_type.lower() == 'shopping' else ListType.TODO
-            
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            lists = await client.get_lists_by_type(list_type_enum)
-            
-            # Return the pydantic models as dictionaries directly
-            return [list_item.model_dump() for list_item in lists]
-        
-        except CoziException as e:
-            logger.error(f"Cozi API error in get_lists_by_type: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in get_lists_by_type")
-            raise
+# Complete results for the bool tools, indexed by the bool
+_BoolResult = Annotated[CallToolResult, bool]
+_BOOL_RESULTS: Tuple[CallToolResult, CallToolResult] = tuple(
+    CallToolResult(
+        content=[TextContent(type="text", text=to_json(value).decode())],
+        structuredContent={"result": value},
+    )
+    for value in (False, True)
+)
 
-    @mcp.tool()
-    async def create_list(name: str, list_type: str, ctx: Context) -> Dict[str, Any]:
-        """Create a new list.
-        
-        Args:
-            name: Name of the new list
-            list_type: Type of list to create ('shopping' or 'todo')
-            
-        Returns:
-            Created list object
-        """
+def _parse_list_type(list_type: str) -> ListType:
+    """Map a 'shopping'/'todo' tool argument to its ListType."""
+    try:
+        return _LIST_TYPE_MAP[list_type.lower()]
+    except KeyError:
+        raise ValidationError(
+            f"Invalid list type {list_type!r}; expected one of: {', '.join(_LIST_TYPE_MAP)}"
+        ) from None
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date/time tool argument, accepting a trailing 'Z'."""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def _construct_list(list_obj: Dict[str, Any]) -> CoziList:
+    """Rebuild a CoziList (and its items) from a dict without revalidating it.
+
+    Meant for dicts this server produced itself, e.g. a list from get_lists()
+    with its items reordered.
+    """
+    items = [CoziItem.model_construct(**item) for item in list_obj.get("items") or ()]
+    return CoziList.model_construct(**{**list_obj, "items": items})
+
+_APPOINTMENT_FIELDS = frozenset(CoziAppointment.model_fields)
+_APPOINTMENT_REQUIRED_FIELDS = frozenset(("subject", "start_day"))
+
+def _construct_appointment(appointment_obj: Dict[str, Any]) -> CoziAppointment:
+    """Rebuild a CoziAppointment from a dict, skipping validation where it is safe.
+
+    Only an appointment shaped like the ones get_calendar() returns, with plain
+    field names and the required fields present, skips full validation. Even
+    then its day and times go through the model's own parsing, since the client
+    formats those when sending the edit. Anything else, such as wire aliases
+    (``day``, ``startTime``) or nested ``itemDetails``, is fully validated.
+    """
+    keys = appointment_obj.keys()
+    if not (_APPOINTMENT_REQUIRED_FIELDS <= keys <= _APPOINTMENT_FIELDS):
+        return CoziAppointment(**appointment_obj)
+    fields = dict(appointment_obj)
+    fields["start_day"] = CoziAppointment.parse_date(fields["start_day"])
+    for name in ("start_time", "end_time"):
+        if name in fields:
+            fields[name] = CoziAppointment.parse_time(fields[name])
+    if not isinstance(fields["start_day"], date) or not all(
+        isinstance(fields.get(name), (time_of_day, type(None))) for name in ("start_time", "end_time")
+    ):
+        # Not something the model's parsers handle, so let validation report it
+        return CoziAppointment(**appointment_obj)
+    return CoziAppointment.model_construct(**fields)
+
+# HTTP connection pool settings for the Cozi API session
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTIONS_PER_HOST = 20
+HTTP_KEEPALIVE_SECONDS = 30.0
+HTTP_DNS_CACHE_SECONDS = 300
+HTTP_REQUEST_TIMEOUT_SECONDS = 30
+
+# How long read-only tool responses are served from memory
+FAMILY_CACHE_TTL_SECONDS = 300.0
+LISTS_CACHE_TTL_SECONDS = 30.0
+CALENDAR_CACHE_TTL_SECONDS = 60.0
+
+class _ResponseCache:
+    """In-process TTL cache of encoded JSON responses for read-only tools.
+
+    Keys are tuples of (account, tool name, *arguments), so mutating tools
+    can drop everything a given read tool has cached for one account. Fetches
+    still in flight are tracked per key too, so concurrent misses can share one.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, str]] = {}
+        self._pending: Dict[Tuple[Hashable, ...], "asyncio.Task[str]"] = {}
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Tuple[Hashable, ...], value: str, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def pending(self, key: Tuple[Hashable, ...]) -> Optional["asyncio.Task[str]"]:
+        return self._pending.get(key)
+
+    def add_pending(self, key: Tuple[Hashable, ...], task: "asyncio.Task[str]", ttl: float) -> None:
+        """Track an in-flight fetch for key and cache its result once it succeeds."""
+        self._pending[key] = task
+        task.add_done_callback(functools.partial(self._settle, key, ttl))
+
+    def _settle(self, key: Tuple[Hashable, ...], ttl: float, task: "asyncio.Task[str]") -> None:
+        if self._pending.get(key) is not task:
+            # Invalidated while in flight, so the result may already be stale
+            return
+        del self._pending[key]
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result(), ttl)
+
+    def invalidate(self, account: str, *tool_names: str) -> None:
+        for entries in (self._entries, self._pending):
+            stale = [key for key in entries if key[0] == account and key[1] in tool_names]
+            for key in stale:
+                del entries[key]
+
+_response_cache = _ResponseCache()
+
+async def _cached_json(
+    key: Tuple[Hashable, ...],
+    ttl: float,
+    fetch: Callable[[], Awaitable[Any]],
+    adapter: TypeAdapter,
+) -> str:
+    """Return the cached JSON for a read tool, fetching and encoding it on a miss.
+
+    Concurrent misses for the same key wait on a single fetch. It is shielded,
+    so one caller being cancelled does not fail the others.
+    """
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached
+    task = _response_cache.pending(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_json(fetch, adapter))
+        _response_cache.add_pending(key, task, ttl)
+    return await asyncio.shield(task)
+
+async def _fetch_json(fetch: Callable[[], Awaitable[Any]], adapter: TypeAdapter) -> str:
+    return adapter.dump_json(await fetch(), **_DUMP_KWARGS).decode()
+
+# Drop an account's client and close its HTTP session after this long without a tool call
+CLIENT_IDLE_TIMEOUT_SECONDS = 1800.0
+
+# Authenticated clients keyed by credentials, so Smithery sessions for
+# different Cozi accounts never share a client
+_clients: Dict[Tuple[str, str], CoziClient] = {}
+_auth_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+# Each client's pooled HTTP session; CoziClient.close() leaves injected sessions open
+_http_sessions: Dict[Tuple[str, str], aiohttp.ClientSession] = {}
+# When each client last served a tool call, and the timer that evicts it once idle
+_last_used: Dict[Tuple[str, str], float] = {}
+_idle_handles: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+_closing_tasks: Set["asyncio.Task[None]"] = set()
+_shutdown_watcher: Optional["asyncio.Task[None]"] = None
+
+def _create_http_session() -> aiohttp.ClientSession:
+    """Create the pooled aiohttp session for one set of Cozi credentials.
+
+    Each account gets its own session, and so its own cookie jar, shared by
+    every request made for that account. Keeps connections to rest.cozi.com
+    alive between tool calls so warm calls skip the TCP and TLS handshakes,
+    and caches the DNS lookup.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT_SECONDS),
+        cookie_jar=aiohttp.CookieJar(),
+    )
+
+async def _ensure_cozi_client(username: str, password: str) -> CoziClient:
+    """Create and authenticate the Cozi client for a set of credentials.
+
+    Only awaited on a cache miss; the _cozi_tool wrapper looks the key up in
+    ``_clients`` inline first, so warm calls never create this coroutine.
+    Concurrent cold callers with the same credentials wait for a single
+    authentication.
+    """
+    if not username or not password:
+        raise AuthenticationError("Cozi username and password must be provided")
+
+    key = (username, password)
+    async with _auth_locks.setdefault(key, asyncio.Lock()):
+        client = _clients.get(key)
+        if client is None:
+            session = _create_http_session()
+            client = CoziClient(
+                username,
+                password,
+                session=session,
+                request_timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
+            )
+            try:
+                await client.authenticate()
+            except Exception:
+                await session.close()
+                _auth_locks.pop(key, None)
+                raise
+            _clients[key] = client
+            _http_sessions[key] = session
+            _last_used[key] = time.monotonic()
+            _schedule_idle_check(key, CLIENT_IDLE_TIMEOUT_SECONDS)
+            _watch_for_shutdown()
+
+    return client
+
+def _schedule_idle_check(key: Tuple[str, str], delay: float) -> None:
+    """Check after delay whether the client for key has gone unused long enough to evict."""
+    _idle_handles[key] = asyncio.get_running_loop().call_later(delay, _evict_if_idle, key)
+
+def _evict_if_idle(key: Tuple[str, str]) -> None:
+    """Drop the client for key and close its session if it has been idle, else check again later.
+
+    A client in use needs no background token refresh, since the client logs
+    in again by itself when Cozi rejects its token. Idle clients are dropped
+    rather than kept logged in, so a multi-tenant deployment only holds
+    sessions for accounts that are actually making calls.
+    """
+    idle_for = time.monotonic() - _last_used.get(key, 0.0)
+    if idle_for < CLIENT_IDLE_TIMEOUT_SECONDS:
+        _schedule_idle_check(key, CLIENT_IDLE_TIMEOUT_SECONDS - idle_for)
+        return
+    _idle_handles.pop(key, None)
+    _last_used.pop(key, None)
+    _clients.pop(key, None)
+    lock = _auth_locks.get(key)
+    if lock is not None and not lock.locked():
+        del _auth_locks[key]
+    session = _http_sessions.pop(key, None)
+    if session is not None:
+        task = asyncio.get_running_loop().create_task(session.close())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+
+def _watch_for_shutdown() -> None:
+    """Make sure the running event loop closes the HTTP sessions when it shuts down."""
+    global _shutdown_watcher
+    if _shutdown_watcher is None or _shutdown_watcher.done():
+        _shutdown_watcher = asyncio.get_running_loop().create_task(_close_sessions_on_shutdown())
+
+async def _close_sessions_on_shutdown() -> None:
+    """Wait to be cancelled, then drop every cached client and close its session.
+
+    asyncio.run() cancels the tasks still pending when the server stops and
+    waits for them to finish, so the sessions close while the loop still runs.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        for handle in _idle_handles.values():
+            handle.cancel()
+        _idle_handles.clear()
+        _last_used.clear()
+        _clients.clear()
+        _auth_locks.clear()
+        sessions = list(_http_sessions.values())
+        _http_sessions.clear()
+        await asyncio.gather(*(session.close() for session in sessions), return_exceptions=True)
+
+def _client_key(ctx: Context) -> Tuple[str, str]:
+    """Return the ``_clients`` key for the request's session credentials."""
+    config = ctx.session_config
+    return config.username, config.password
+
+def _cozi_tool(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Turn a tool body that takes a CoziClient first into a FastMCP tool function.
+
+    FastMCP sees the body's remaining parameters plus an injected ``ctx``. The
+    wrapper resolves the session's authenticated client and logs errors before
+    re-raising them: Cozi API errors as a single line, anything else with its
+    traceback. Each tool logs through its own child logger, named after it.
+    """
+    log = logger.getChild(fn.__name__)
+    signature = inspect.signature(fn)
+    tool_params = list(signature.parameters.values())[1:]
+    tool_params.append(inspect.Parameter("ctx", inspect.Parameter.KEYWORD_ONLY, annotation=Context))
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, ctx: Context, **kwargs: Any) -> Any:
         try:
-            # Convert string to ListType enum
-            list_type_enum = ListType.SHOPPING if list_type.lower() == 'shopping' else ListType.TODO
-            
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            new_list = await client.create_list(name, list_type_enum)
-            
-            # Return the pydantic model as dictionary directly
-            return new_list.model_dump()
-        
+            key = _client_key(ctx)
+            client = _clients.get(key) or await _ensure_cozi_client(*key)
+            _last_used[key] = time.monotonic()
+            return await fn(client, *args, **kwargs)
         except CoziException as e:
-            logger.error(f"Cozi API error in create_list: {e}")
+            log.error("Cozi API error: %s", e)
             raise
-        except Exception as e:
-            logger.exception("Unexpected error in create_list")
+        except Exception:
+            log.exception("Unexpected error")
             raise
 
-    @mcp.tool()
-    async def delete_list(list_id: str, ctx: Context) -> bool:
-        """Delete an existing list.
+    wrapper.__signature__ = signature.replace(parameters=tool_params)
+    wrapper.__annotations__ = {
+        **{param.name: param.annotation for param in tool_params},
+        "return": signature.return_annotation,
+    }
+    return wrapper
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Run the serving event loop with eager task creation where supported.
+
+    On Python 3.12+ tasks spawned for incoming requests start executing
+    immediately instead of waiting for the next loop iteration, and any that
+    finish without suspending never get scheduled at all.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop = asyncio.get_running_loop()
+        if loop.get_task_factory() is None:
+            loop.set_task_factory(eager_task_factory)
+    yield
+
+# Family member tools
+@_cozi_tool
+async def get_family_members(client: CoziClient) -> str:
+    """Get all family members in the Cozi account.
+
+    This is often used as a first step when creating appointments with specific attendees.
+    Use the 'id' field from each family member when specifying attendees for appointments.
+
+    Returns:
+        List of family member objects with their details including:
+        - id: Unique identifier (use this for appointment attendees)
+        - name: Display name
+        - Other member details
+
+    Example workflow:
+        1. Call get_family_members() to get family member IDs
+        2. Use those IDs in the attendees parameter when creating appointments
+    """
+    return await _cached_json(
+        (client.username, "get_family_members"),
+        FAMILY_CACHE_TTL_SECONDS,
+        client.get_family_members,
+        _family_members_adapter,
+    )
+
+# List management tools
+@_cozi_tool
+async def get_lists(client: CoziClient) -> str:
+    """Get all lists (shopping and todo lists).
+    
+    Returns:
+        List of list objects with their items
+    """
+    return await _cached_json(
+        (client.username, "get_lists"),
+        LISTS_CACHE_TTL_SECONDS,
+        client.get_lists,
+        _lists_adapter,
+    )
+
+@_cozi_tool
+async def get_lists_by_type(client: CoziClient, list_type: str) -> str:
+    """Get lists filtered by type.
+    
+    Args:
+        list_type: Type of lists to retrieve ('shopping' or 'todo')
         
-        Args:
-            list_id: ID of the list to delete
-            
-        Returns:
-            True if deletion was successful
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            result = await client.delete_list(list_id)
-            
-            return result
+    Returns:
+        List of list objects filtered by type
+    """
+    list_type_enum = _parse_list_type(list_type)
+    
+    return await _cached_json(
+        (client.username, "get_lists_by_type", list_type_enum),
+        LISTS_CACHE_TTL_SECONDS,
+        functools.partial(client.get_lists_by_type, list_type_enum),
+        _lists_adapter,
+    )
+
+@_cozi_tool
+async def create_list(client: CoziClient, name: str, list_type: str) -> str:
+    """Create a new list.
+    
+    Args:
+        name: Name of the new list
+        list_type: Type of list to create ('shopping' or 'todo')
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in delete_list: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in delete_list")
-            raise
+    Returns:
+        Created list object
+    """
+    list_type_enum = _parse_list_type(list_type)
+    
+    new_list = await client.create_list(name, list_type_enum)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
+    
+    return new_list.model_dump_json(**_DUMP_KWARGS)
 
-    # Item management tools
-    @mcp.tool()
-    async def add_item(list_id: str, item_text: str, ctx: Context) -> Dict[str, Any]:
-        """Add an item to a list.
-        
-        Args:
-            list_id: ID of the list to add item to
-            item_text: Text content of the item to add
-            
-        Returns:
-            Updated list object with the new item
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            updated_list = await client.add_item(list_id, item_text)
-            
-            # Return the pydantic model as dictionary directly
-            return updated_list.model_dump()
+@_cozi_tool
+async def delete_list(client: CoziClient, list_id: str) -> _BoolResult:
+    """Delete an existing list.
+    
+    Args:
+        list_id: ID of the list to delete
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in add_item: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in add_item")
-            raise
+    Returns:
+        True if deletion was successful
+    """
+    result = await client.delete_list(list_id)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
+    
+    return _BOOL_RESULTS[result]
 
-    @mcp.tool()
-    async def update_item_text(list_id: str, item_id: str, new_text: str, ctx: Context) -> Dict[str, Any]:
-        """Update the text of an existing item.
-        
-        Args:
-            list_id: ID of the list containing the item
-            item_id: ID of the item to update
-            new_text: New text content for the item
-            
-        Returns:
-            Updated list object
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            updated_list = await client.update_item_text(list_id, item_id, new_text)
-            
-            # Return the pydantic model as dictionary directly
-            return updated_list.model_dump()
+# Item management tools
+@_cozi_tool
+async def add_item(client: CoziClient, list_id: str, item_text: str) -> str:
+    """Add an item to a list.
+    
+    Args:
+        list_id: ID of the list to add item to
+        item_text: Text content of the item to add
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in update_item_text: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in update_item_text")
-            raise
+    Returns:
+        Updated list object with the new item
+    """
+    updated_list = await client.add_item(list_id, item_text)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
+    
+    return updated_list.model_dump_json(**_DUMP_KWARGS)
 
-    @mcp.tool()
-    async def mark_item(list_id: str, item_id: str, completed: bool, ctx: Context) -> Dict[str, Any]:
-        """Mark an item as complete or incomplete.
-        
-        Args:
-            list_id: ID of the list containing the item
-            item_id: ID of the item to mark
-            completed: True to mark complete, False to mark incomplete
-            
-        Returns:
-            Updated list object
-        """
-        try:
-            status = ItemStatus.COMPLETE if completed else ItemStatus.INCOMPLETE
-            
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            updated_list = await client.mark_item(list_id, item_id, status)
-            
-            # Return the pydantic model as dictionary directly
-            return updated_list.model_dump()
+@_cozi_tool
+async def update_item_text(client: CoziClient, list_id: str, item_id: str, new_text: str) -> str:
+    """Update the text of an existing item.
+    
+    Args:
+        list_id: ID of the list containing the item
+        item_id: ID of the item to update
+        new_text: New text content for the item
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in mark_item: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in mark_item")
-            raise
-
-    @mcp.tool()
-    async def remove_items(list_id: str, item_ids: List[str], ctx: Context) -> bool:
-        """Remove items from a list.
-
-        Args:
-            list_id: ID of the list to remove items from
-            item_ids: List of item IDs to remove
-
-        Returns:
-            True if removal was successful
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            result = await client.remove_items(list_id, item_ids)
-
-            return result
-
-        except CoziException as e:
-            logger.error(f"Cozi API error in remove_items: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in remove_items")
-            raise
+    Returns:
+        Updated list object
+    """
+    updated_list = await client.update_item_text(list_id, item_id, new_text)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
+    
+    return updated_list.model_dump_json(**_DUMP_KWARGS)
 
-    # Calendar management tools
-    @mcp.tool()
-    async def get_calendar(year: int, month: int, ctx: Context) -> List[Dict[str, Any]]:
-        """Get calendar appointments for a specific month.
-        
-        Args:
-            year: Year (e.g., 2024)
-            month: Month number (1-12)
-            
-        Returns:
-            List of appointment objects for the specified month
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            appointments = await client.get_calendar(year, month)
-            
-            # Return the pydantic models as dictionaries directly
-            return [appt.model_dump() for appt in appointments]
+@_cozi_tool
+async def mark_item(client: CoziClient, list_id: str, item_id: str, completed: bool) -> str:
+    """Mark an item as complete or incomplete.
+    
+    Args:
+        list_id: ID of the list containing the item
+        item_id: ID of the item to mark
+        completed: True to mark complete, False to mark incomplete
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in get_calendar: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in get_calendar")
-            raise
-
-    @mcp.tool()
-    async def create_appointment(
-        subject: str,
-        start_date: str,
-        end_date: str,
-        attendees: List[str] = None,
-        all_day: bool = False,
-        notes: str = "",
-        ctx: Context = None
-    ) -> Dict[str, Any]:
-        """Create a new calendar appointment.
-
-        When creating appointments for specific people, first use get_family_members()
-        to get the family member IDs, then include those IDs in the attendees parameter.
-
-        Args:
-            subject: Appointment title/subject (e.g., "Soccer practice - Alice, Bob, Charlie")
-            start_date: Start date/time in ISO format (e.g., "2024-03-15T10:00:00")
-            end_date: End date/time in ISO format (e.g., "2024-03-15T11:00:00")
-            attendees: List of family member IDs who will attend this event.
-                      Use get_family_members() first to get the correct IDs.
-                      Leave empty for family-wide events (default: empty list)
-            all_day: Whether this is an all-day event (default: False)
-            notes: Additional notes for the appointment (default: "")
-
-        Returns:
-            Created appointment object
-
-        Example workflow for appointments with specific people:
-            1. Call get_family_members() to get family member details
-            2. Find the IDs of the people mentioned in the appointment
-            3. Pass those IDs in the attendees parameter
-
-        Example:
-            # For "Soccer practice - Alice, Bob, Charlie"
-            # First get family members, find Alice's, Bob's, and Charlie's IDs
-            # Then call: create_appointment(
-            #   subject="Soccer practice - Alice, Bob, Charlie",
-            #   attendees=["alice-id-123", "bob-id-456", "charlie-id-789"],
-            #   ...
-            # )
-        """
-        try:
-            # Parse ISO date strings to datetime objects
-            start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-
-            # Create CoziAppointment object with the correct field names
-            appointment_data = {
-                'subject': subject,
-                'start_day': start_dt.date(),
-                'notes': notes,
-                'attendees': attendees if attendees is not None else []
-            }
-
-            # Add time fields only if not all-day
-            if not all_day:
-                appointment_data['start_time'] = start_dt.time()
-                appointment_data['end_time'] = end_dt.time()
+    Returns:
+        Updated list object
+    """
+    status = _ITEM_STATUS_BY_COMPLETED[completed]
+    
+    updated_list = await client.mark_item(list_id, item_id, status)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
+    
+    return updated_list.model_dump_json(**_DUMP_KWARGS)
 
-            appointment = CoziAppointment(**appointment_data)
+@_cozi_tool
+async def remove_items(client: CoziClient, list_id: str, item_ids: List[str]) -> _BoolResult:
+    """Remove items from a list.
 
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            created_appointment = await client.create_appointment(appointment)
+    Args:
+        list_id: ID of the list to remove items from
+        item_ids: List of item IDs to remove
 
-            # Return the pydantic model as dictionary directly
-            return created_appointment.model_dump()
+    Returns:
+        True if removal was successful
+    """
+    result = await client.remove_items(list_id, item_ids)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
 
-        except CoziException as e:
-            logger.error(f"Cozi API error in create_appointment: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in create_appointment")
-            raise
+    return _BOOL_RESULTS[result]
 
-    @mcp.tool()
-    async def update_appointment(appointment_obj: Dict[str, Any], ctx: Context) -> Dict[str, Any]:
-        """Update an existing calendar appointment.
-
-        To modify attendees for an appointment, use get_family_members() to get the
-        correct family member IDs, then update the 'attendees' field in the appointment object.
-
-        Args:
-            appointment_obj: Appointment object dictionary to update. Modify any fields
-                           you want to change, including:
-                           - subject: Change the title
-                           - attendees: List of family member IDs (use get_family_members() first)
-                           - start_day, start_time, end_time: Change timing
-                           - notes: Add or modify notes
-                           - all other appointment fields
-
-        Returns:
-            Updated appointment object
-
-        Example workflow for modifying attendees:
-            1. Get the current appointment (from get_calendar() or previous operations)
-            2. Call get_family_members() to get family member details
-            3. Find the IDs of people who should attend
-            4. Modify the appointment_obj['attendees'] field with the new list of IDs
-            5. Call update_appointment() with the modified appointment object
-
-        Example:
-            # To add or change attendees for an existing appointment
-            # 1. Get appointment from calendar
-            # 2. Get family members to find IDs
-            # 3. Update attendees:
-            # appointment_obj['attendees'] = ['alice-id-123', 'bob-id-456']
-            # 4. Call update_appointment(appointment_obj)
-        """
-        try:
-            # Convert dictionary back to pydantic model
-            appointment = CoziAppointment(**appointment_obj)
-            
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            updated_appointment = await client.update_appointment(appointment)
-            
-            # Return the pydantic model as dictionary directly
-            return updated_appointment.model_dump()
+# Calendar management tools
+@_cozi_tool
+async def get_calendar(client: CoziClient, year: int, month: int) -> str:
+    """Get calendar appointments for a specific month.
+    
+    Args:
+        year: Year (e.g., 2024)
+        month: Month number (1-12)
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in update_appointment: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in update_appointment")
-            raise
+    Returns:
+        List of appointment objects for the specified month
+    """
+    return await _cached_json(
+        (client.username, "get_calendar", year, month),
+        CALENDAR_CACHE_TTL_SECONDS,
+        functools.partial(client.get_calendar, year, month),
+        _appointments_adapter,
+    )
+
+@_cozi_tool
+async def create_appointment(
+    client: CoziClient,
+    subject: str,
+    start_date: str,
+    end_date: str,
+    attendees: List[str] = None,
+    all_day: bool = False,
+    notes: str = ""
+) -> str:
+    """Create a new calendar appointment.
+
+    When creating appointments for specific people, first use get_family_members()
+    to get the family member IDs, then include those IDs in the attendees parameter.
+
+    Args:
+        subject: Appointment title/subject (e.g., "Soccer practice - Alice, Bob, Charlie")
+        start_date: Start date/time in ISO format (e.g., "2024-03-15T10:00:00")
+        end_date: End date/time in ISO format (e.g., "2024-03-15T11:00:00")
+        attendees: List of family member IDs who will attend this event.
+                  Use get_family_members() first to get the correct IDs.
+                  Leave empty for family-wide events (default: empty list)
+        all_day: Whether this is an all-day event (default: False)
+        notes: Additional notes for the appointment (default: "")
+
+    Returns:
+        Created appointment object
+
+    Example workflow for appointments with specific people:
+        1. Call get_family_members() to get family member details
+        2. Find the IDs of the people mentioned in the appointment
+        3. Pass those IDs in the attendees parameter
+
+    Example:
+        # For "Soccer practice - Alice, Bob, Charlie"
+        # First get family members, find Alice's, Bob's, and Charlie's IDs
+        # Then call: create_appointment(
+        #   subject="Soccer practice - Alice, Bob, Charlie",
+        #   attendees=["alice-id-123", "bob-id-456", "charlie-id-789"],
+        #   ...
+        # )
+    """
+    # Parse ISO date strings to datetime objects
+    start_dt = _parse_iso_datetime(start_date)
+    end_dt = _parse_iso_datetime(end_date)
+
+    # The arguments are already validated and converted, so skip model validation;
+    # all-day events leave the time fields at their None default
+    appointment = CoziAppointment.model_construct(
+        subject=subject,
+        start_day=start_dt.date(),
+        start_time=None if all_day else start_dt.time(),
+        end_time=None if all_day else end_dt.time(),
+        notes=notes,
+        attendees=attendees if attendees is not None else [],
+    )
+
+    created_appointment = await client.create_appointment(appointment)
+    _response_cache.invalidate(client.username, "get_calendar")
+
+    return created_appointment.model_dump_json(**_DUMP_KWARGS)
+
+@_cozi_tool
+async def update_appointment(
+    client: CoziClient,
+    appointment_obj: Dict[str, Any],
+    validate: bool = False
+) -> str:
+    """Update an existing calendar appointment.
+
+    To modify attendees for an appointment, use get_family_members() to get the
+    correct family member IDs, then update the 'attendees' field in the appointment object.
+
+    Args:
+        appointment_obj: Appointment object dictionary to update. Modify any fields
+                       you want to change, including:
+                       - subject: Change the title
+                       - attendees: List of family member IDs (use get_family_members() first)
+                       - start_day, start_time, end_time: Change timing
+                       - notes: Add or modify notes
+                       - all other appointment fields
+        validate: Fully validate appointment_obj before sending it (default: False).
+                  Set this when the dictionary was not taken from a previous
+                  appointment response.
+
+    Returns:
+        Updated appointment object
+
+    Example workflow for modifying attendees:
+        1. Get the current appointment (from get_calendar() or previous operations)
+        2. Call get_family_members() to get family member details
+        3. Find the IDs of people who should attend
+        4. Modify the appointment_obj['attendees'] field with the new list of IDs
+        5. Call update_appointment() with the modified appointment object
+
+    Example:
+        # To add or change attendees for an existing appointment
+        # 1. Get appointment from calendar
+        # 2. Get family members to find IDs
+        # 3. Update attendees:
+        # appointment_obj['attendees'] = ['alice-id-123', 'bob-id-456']
+        # 4. Call update_appointment(appointment_obj)
+    """
+    # Convert dictionary back to pydantic model
+    appointment = (
+        CoziAppointment(**appointment_obj) if validate else _construct_appointment(appointment_obj)
+    )
+    
+    updated_appointment = await client.update_appointment(appointment)
+    _response_cache.invalidate(client.username, "get_calendar")
+    
+    return updated_appointment.model_dump_json(**_DUMP_KWARGS)
 
-    @mcp.tool()
-    async def delete_appointment(appointment_id: str, ctx: Context) -> bool:
-        """Delete a calendar appointment.
-        
-        Args:
-            appointment_id: ID of the appointment to delete
-            
-        Returns:
-            True if deletion was successful
-        """
-        try:
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            result = await client.delete_appointment(appointment_id)
-            
-            return result
+@_cozi_tool
+async def delete_appointment(client: CoziClient, appointment_id: str) -> _BoolResult:
+    """Delete a calendar appointment.
+    
+    Args:
+        appointment_id: ID of the appointment to delete
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in delete_appointment: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in delete_appointment")
-            raise
+    Returns:
+        True if deletion was successful
+    """
+    result = await client.delete_appointment(appointment_id)
+    _response_cache.invalidate(client.username, "get_calendar")
+    
+    return _BOOL_RESULTS[result]
 
-    # Additional list management tool
-    @mcp.tool()
-    async def update_list(list_obj: Dict[str, Any], ctx: Context) -> Dict[str, Any]:
-        """Update an existing list (mainly for reordering items).
-        
-        Args:
-            list_obj: List object dictionary to update
-            
-        Returns:
-            Updated list object
-        """
-        try:
-            # Convert dictionary back to pydantic model
-            cozi_list = CoziList(**list_obj)
-            
-            config = ctx.session_config
-            client = await get_cozi_client(config.username, config.password)
-            updated_list = await client.update_list(cozi_list)
-            
-            # Return the pydantic model as dictionary directly
-            return updated_list.model_dump()
+# Additional list management tool
+@_cozi_tool
+async def update_list(client: CoziClient, list_obj: Dict[str, Any], validate: bool = False) -> str:
+    """Update an existing list (mainly for reordering items).
+    
+    Args:
+        list_obj: List object dictionary to update, as returned by get_lists()
+        validate: Fully validate list_obj before sending it (default: False).
+                  Set this when the dictionary was not taken from a previous
+                  list response.
         
-        except CoziException as e:
-            logger.error(f"Cozi API error in update_list: {e}")
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in update_list")
-            raise
+    Returns:
+        Updated list object
+    """
+    # Convert dictionary back to pydantic model
+    cozi_list = CoziList(**list_obj) if validate else _construct_list(list_obj)
+    
+    updated_list = await client.update_list(cozi_list)
+    _response_cache.invalidate(client.username, "get_lists", "get_lists_by_type")
+    
+    return updated_list.model_dump_json(**_DUMP_KWARGS)
+
+# Compound read tools
+@_cozi_tool
+async def get_snapshot(client: CoziClient, year: int, month: int) -> str:
+    """Get family members, all lists and a month of appointments in one call.
+
+    Fetches the three concurrently, so prefer this over calling
+    get_family_members(), get_lists() and get_calendar() one after another
+    when you need an overview of the family's current state.
+
+    Args:
+        year: Year of the calendar month to include (e.g., 2024)
+        month: Month number of the calendar month to include (1-12)
+
+    Returns:
+        Object with these keys:
+        - family_members: Same as get_family_members()
+        - lists: Same as get_lists()
+        - calendar: Same as get_calendar(year, month)
+    """
+    family_members, lists, calendar = await asyncio.gather(
+        _cached_json(
+            (client.username, "get_family_members"),
+            FAMILY_CACHE_TTL_SECONDS,
+            client.get_family_members,
+            _family_members_adapter,
+        ),
+        _cached_json(
+            (client.username, "get_lists"),
+            LISTS_CACHE_TTL_SECONDS,
+            client.get_lists,
+            _lists_adapter,
+        ),
+        _cached_json(
+            (client.username, "get_calendar", year, month),
+            CALENDAR_CACHE_TTL_SECONDS,
+            functools.partial(client.get_calendar, year, month),
+            _appointments_adapter,
+        ),
+    )
+
+    # Splice the already-encoded parts instead of decoding and re-encoding them
+    return f'{{"family_members":{family_members},"lists":{lists},"calendar":{calendar}}}'
+
+# Tools registered by create_server, in order, with their structured_output setting
+_TOOLS: Tuple[Tuple[Callable[..., Awaitable[Any]], Optional[bool]], ...] = (
+    (get_family_members, False),
+    (get_lists, False),
+    (get_lists_by_type, False),
+    (create_list, False),
+    (delete_list, None),
+    (add_item, False),
+    (update_item_text, False),
+    (mark_item, False),
+    (remove_items, None),
+    (get_calendar, False),
+    (create_appointment, False),
+    (update_appointment, False),
+    (delete_appointment, None),
+    (update_list, False),
+    (get_snapshot, False),
+)
 
+@smithery.server(config_schema=CoziConfigSchema)
+def create_server():
+    """Create the Cozi MCP server for Smithery deployment."""
+    _configure_logging()
+    mcp = FastMCP("cozi-mcp", lifespan=server_lifespan)
+    for tool, structured_output in _TOOLS:
+        mcp.tool(structured_output=structured_output)(tool)
     return mcp
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Read tools share in-flight fetches and logins, and never cache stale or failed results."""
+
+import asyncio
+
+import pytest
+from cozi_client import CoziException, CoziList
+
+from cozi_mcp import server
+
+
+class StubClient:
+    """Stands in for an authenticated CoziClient; get_lists blocks until released."""
+
+    username = "user@example.com"
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.failures = 0
+
+    async def get_lists(self):
+        self.calls += 1
+        version = self.calls
+        await self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            raise CoziException("upstream failed")
+        return [CoziList(id="l1", title="Groceries", list_type="shopping", items=[], version=version)]
+
+    async def create_list(self, name, list_type):
+        return CoziList(id="l2", title=name, list_type=list_type.value, items=[])
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(server, "_response_cache", server._ResponseCache())
+
+
+async def get_lists(client):
+    return await server.get_lists.__wrapped__(client)
+
+
+async def settle():
+    # Let started tasks run up to the point where they block on the stub
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_fetch():
+    client = StubClient()
+    readers = [asyncio.ensure_future(get_lists(client)) for _ in range(20)]
+    await settle()
+    client.release.set()
+    results = await asyncio.gather(*readers)
+    assert client.calls == 1
+    assert len(set(results)) == 1
+    assert await get_lists(client) == results[0]
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_reader_does_not_fail_the_others():
+    client = StubClient()
+    first, second = (asyncio.ensure_future(get_lists(client)) for _ in range(2))
+    await settle()
+    first.cancel()
+    client.release.set()
+    assert await second
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_mid_fetch_is_not_cached():
+    client = StubClient()
+    before = asyncio.ensure_future(get_lists(client))
+    await settle()
+    await server.create_list.__wrapped__(client, "Hardware", "shopping")
+    after = asyncio.ensure_future(get_lists(client))
+    await settle()
+    client.release.set()
+    stale, fresh = await asyncio.gather(before, after)
+    # A read started after the write does not join the fetch it invalidated
+    assert client.calls == 2
+    assert stale != fresh
+    assert await get_lists(client) == fresh
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    client = StubClient()
+    client.failures = 1
+    client.release.set()
+    with pytest.raises(CoziException):
+        await get_lists(client)
+    assert await get_lists(client)
+    assert client.calls == 2
+
+
+class StubCoziClient:
+    """Stands in for the CoziClient class; counts logins and blocks them until released."""
+
+    logins = 0
+    release: asyncio.Event
+
+    def __init__(self, username, password, session=None, request_timeout=None):
+        self.username = username
+
+    async def authenticate(self):
+        type(self).logins += 1
+        await type(self).release.wait()
+
+
+@pytest.fixture
+def stub_cozi_client(monkeypatch):
+    monkeypatch.setattr(StubCoziClient, "logins", 0)
+    monkeypatch.setattr(StubCoziClient, "release", asyncio.Event(), raising=False)
+    monkeypatch.setattr(server, "CoziClient", StubCoziClient)
+    monkeypatch.setattr(server, "_shutdown_watcher", None)
+    return StubCoziClient
+
+
+async def close_clients():
+    server._shutdown_watcher.cancel()
+    await asyncio.gather(server._shutdown_watcher, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_callers_log_in_once(stub_cozi_client):
+    callers = [asyncio.ensure_future(server._ensure_cozi_client("user", "pw")) for _ in range(10)]
+    await settle()
+    stub_cozi_client.release.set()
+    clients = await asyncio.gather(*callers)
+    try:
+        assert stub_cozi_client.logins == 1
+        assert all(client is clients[0] for client in clients)
+        assert server._clients[("user", "pw")] is clients[0]
+    finally:
+        await close_clients()
+    assert not server._clients and not server._http_sessions
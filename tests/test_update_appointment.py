@@ -0,0 +1,67 @@
+"""update_appointment must send the same edit as fully validating its input."""
+
+from datetime import date
+
+import pydantic
+import pytest
+from cozi_client import CoziAppointment
+
+from cozi_mcp import server
+
+
+class StubClient:
+    username = "user@example.com"
+
+    def __init__(self):
+        self.sent = []
+
+    async def update_appointment(self, appointment):
+        self.sent.append(appointment)
+        return appointment
+
+
+async def sent_edit(appointment_obj):
+    client = StubClient()
+    await server.update_appointment.__wrapped__(client, appointment_obj)
+    return client.sent[0].to_api_edit_format()["edit"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "appointment_obj",
+    [
+        # As returned by get_calendar()
+        {"id": "a1", "subject": "Soccer", "start_day": "2024-03-15",
+         "start_time": "10:00:00", "end_time": "11:30:00", "attendees": ["p1"]},
+        # Wire aliases
+        {"id": "a1", "subject": "Soccer", "start_day": "2024-03-15", "startTime": "10:00"},
+        {"id": "a1", "description": "Soccer", "day": "2024-03-15"},
+        # Datetime string for the day
+        {"id": "a1", "subject": "Soccer", "start_day": "2024-03-15T10:00:00"},
+        # Nested details
+        {"id": "a1", "subject": "Soccer", "start_day": "2024-03-15", "itemDetails": {"location": "Gym"}},
+    ],
+)
+async def test_matches_full_validation(appointment_obj):
+    expected = CoziAppointment(**appointment_obj).to_api_edit_format()["edit"]
+    assert await sent_edit(appointment_obj) == expected
+
+
+@pytest.mark.asyncio
+async def test_aliased_times_are_parsed():
+    edit = await sent_edit({"id": "a1", "subject": "Soccer", "day": "2024-03-15", "startTime": "10:00"})
+    assert edit["startDay"] == "2024-03-15"
+    assert edit["details"]["startTime"] == "10:00"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start_day", [None, ""])
+async def test_empty_day_defaults_to_today(start_day):
+    edit = await sent_edit({"id": "a1", "subject": "Soccer", "start_day": start_day})
+    assert edit["startDay"] == date.today().isoformat()
+
+
+@pytest.mark.asyncio
+async def test_missing_day_is_rejected():
+    with pytest.raises(pydantic.ValidationError):
+        await sent_edit({"id": "a1", "subject": "Soccer"})